@@ -1,115 +1,255 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import json
-from datetime import datetime, timedelta
+import numpy as np
+import plotly.graph_objects as go
+import orjson
+import os
+import re
+import math
+import functools
+import uuid
+from datetime import date, datetime, timedelta
 
 
 st.set_page_config(layout="wide")
 
-def load_data():
-    with open('data.json', 'r', encoding='utf-8') as f:
-        data = json.load(f)
+DATA_FILE = 'data.json'
+
+@st.cache_data(show_spinner=False)
+def load_data(mtime):
+    # mtime ne sert que de clé de cache : le fichier est relu s'il a été modifié
+    with open(DATA_FILE, 'rb') as f:
+        data = orjson.loads(f.read())
     return data
 
+CATEGORY_KEYWORDS = {
+    'Viande': ['viande', 'bœuf', 'veau', 'porc', 'agneau', 'mouton'],
+    'Volaille': ['volaille', 'poulet', 'dinde'],
+    'Charcuterie': ['charcuterie'],
+    'Produits Laitiers': ['lait', 'produits laitiers', 'ovoproduits'],
+    'Fruits et Légumes': ['fruits', 'légumes', 'aromates'],
+    'Surgelés': ['surgelé'],
+    'BIO': ['bio'],
+    'Épicerie': ['épicerie', 'féculents', 'pâtes', 'riz', 'condiments', 'épices'],
+    'Poisson': ['poisson'],
+    'Boissons': ['boisson'],
+    'Desserts': ['dessert', 'pâtisserie', 'compote']
+}
+
+# Index inverse mot-clé -> catégories, et une seule regex pour tous les mots-clés.
+# Le lookahead trouve les mots-clés qui se chevauchent à des positions différentes,
+# mais un seul par position : aucun mot-clé ne doit donc être le préfixe d'un autre.
+KEYWORD_TO_CATS = {}
+for _category, _keywords in CATEGORY_KEYWORDS.items():
+    for _keyword in _keywords:
+        KEYWORD_TO_CATS.setdefault(_keyword, []).append(_category)
+if any(other != kw and other.startswith(kw) for kw in KEYWORD_TO_CATS for other in KEYWORD_TO_CATS):
+    raise ValueError("Un mot-clé de CATEGORY_KEYWORDS ne peut pas être le préfixe d'un autre")
+KEYWORD_PATTERN = re.compile(
+    '(?=(' + '|'.join(map(re.escape, sorted(KEYWORD_TO_CATS, key=len, reverse=True))) + '))'
+)
+
+# Un bit par catégorie : les catégories d'un AO tiennent dans un seul entier
+CATEGORY_BITS = {category: 1 << i for i, category in enumerate(CATEGORY_KEYWORDS)}
+
+@functools.lru_cache(maxsize=4096)
 def categorize_lot(lot_name):
     """
     Fonction qui catégorise un lot en fonction de mots-clés
-    Retourne une liste de catégories auxquelles le lot appartient
+    Retourne un tuple (partageable entre appels) des catégories auxquelles le lot appartient
     """
-    lot_name = lot_name.lower()
-    categories = []
-    
-    category_keywords = {
-        'Viande': ['viande', 'bœuf', 'veau', 'porc', 'agneau', 'mouton'],
-        'Volaille': ['volaille', 'poulet', 'dinde'],
-        'Charcuterie': ['charcuterie'],
-        'Produits Laitiers': ['lait', 'produits laitiers', 'ovoproduits'],
-        'Fruits et Légumes': ['fruits', 'légumes', 'aromates'],
-        'Surgelés': ['surgelé'],
-        'BIO': ['bio'],
-        'Épicerie': ['épicerie', 'féculents', 'pâtes', 'riz', 'condiments', 'épices'],
-        'Poisson': ['poisson'],
-        'Boissons': ['boisson'],
-        'Desserts': ['dessert', 'pâtisserie', 'compote']
+    found = {cat for kw in KEYWORD_PATTERN.findall(lot_name.lower()) for cat in KEYWORD_TO_CATS[kw]}
+    return tuple(category for category in CATEGORY_KEYWORDS if category in found)
+
+def categorize_lots(lots):
+    """Union des catégories de paires (lot, catégories), dans l'ordre de CATEGORY_KEYWORDS"""
+    found = set().union(*(categories for _, categories in lots))
+    return tuple(category for category in CATEGORY_KEYWORDS if category in found)
+
+# Champs de data.json utilisés par le tableau de bord
+SOURCE_COLUMNS = ['idweb', 'objet', 'nomacheteur', 'titulaire', 'code_departement',
+                  'LOTS', 'url_avis', 'date_debut', 'date_fin']
+
+# Le TTL rafraîchit Days_Left et Status au fil des jours sans modification du fichier.
+# Renvoie aussi un jeton de version, nouveau à chaque reconstruction, qui sert de clé
+# aux caches dérivés du DataFrame.
+@st.cache_data(show_spinner=False, ttl=timedelta(hours=1))
+def prepare_timeline_data(_data, mtime):
+    raw = pd.DataFrame(_data, columns=SOURCE_COLUMNS)
+    
+    start_dates = pd.to_datetime(raw['date_debut'], format='ISO8601', errors='coerce')
+    end_dates = pd.to_datetime(raw['date_fin'], format='ISO8601', errors='coerce')
+    
+    # Les dates absentes sont ignorées, les dates illisibles sont signalées
+    invalid = (raw['date_debut'].notna() & start_dates.isna()) | (raw['date_fin'].notna() & end_dates.isna())
+    for idweb in raw.loc[invalid, 'idweb'].fillna('ID inconnu'):
+        st.warning(f"Erreur avec l'entrée: {idweb} - date invalide")
+    
+    valid = start_dates.notna() & end_dates.notna()
+    
+    # Champs texte obligatoires : les entrées incomplètes sont signalées et ignorées
+    for field in ('objet', 'nomacheteur'):
+        missing = valid & ~raw[field].map(lambda v: isinstance(v, str)).astype(bool)
+        for idweb in raw.loc[missing, 'idweb'].fillna('ID inconnu'):
+            st.warning(f"Erreur avec l'entrée: {idweb} - champ manquant: {field}")
+        valid &= ~missing
+    
+    raw = raw[valid]
+    start_dates = start_dates[valid]
+    end_dates = end_dates[valid]
+    if raw.empty:
+        return pd.DataFrame(), None
+    
+    # Jours calendaires restants, calculés en une passe sur le tableau datetime64[D]
+    days_left = pd.Series(
+        (end_dates.to_numpy().astype('datetime64[D]') - np.datetime64(date.today(), 'D')).astype('int64'),
+        index=raw.index
+    )
+    status = pd.Series(np.where(days_left < 0, "Terminé", "En cours"), index=raw.index)
+    
+    # Chaînes Arrow : troncature et concaténation vectorisées sur le buffer UTF-8
+    objet = raw['objet'].astype('string[pyarrow]')
+    short_objet = objet.str.slice(0, 80)
+    task = '[' + status.astype('string[pyarrow]') + '] ' + short_objet.where(objet.str.len() <= 80, short_objet + '...')
+    
+    # Les éléments des listes sont convertis en texte, comme les valeurs isolées
+    titulaires = raw['titulaire'].map(lambda t: ", ".join(map(str, t)) if isinstance(t, list) else str(t))
+    # Tuples plutôt que listes : immuables, hachables et plus compacts
+    departments = raw['code_departement'].map(lambda d: tuple(map(str, d)) if isinstance(d, list) else (str(d),))
+    
+    # Traitement des lots : chaque lot est stocké avec ses catégories
+    lots = raw['LOTS'].map(
+        lambda l: tuple((str(lot), categorize_lot(str(lot))) for lot in l) if isinstance(l, list) else ()
+    )
+    categories = lots.map(categorize_lots)
+    
+    timeline_df = pd.DataFrame(dict(
+        Task=task,
+        Start=start_dates,
+        Finish=end_dates,
+        Resource=raw['nomacheteur'],
+        Department=departments.map(", ".join),
+        Departments=departments,
+        Titulaire=titulaires,
+        Days_Left=days_left,
+        Status=status,
+        Lots=lots,
+        Categories=categories,
+        Category_Bits=categories.map(lambda cats: sum(CATEGORY_BITS[c] for c in cats)).astype('int64'),
+        URL=raw['url_avis'].fillna('')  # Ajout de l'URL
+    ))
+    # Colonnes à faible cardinalité : moins de mémoire et des isin() plus rapides
+    for col in ('Resource', 'Status', 'Department'):
+        timeline_df[col] = timeline_df[col].astype('category')
+    return timeline_df.reset_index(drop=True), uuid.uuid4().hex
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def explode_multivalued(_df, version):
+    """
+    Forme longue (une ligne par valeur) des colonnes multi-valuées,
+    indexée comme le DataFrame d'origine pour servir de masque de filtre
+    """
+    return {
+        'Titulaire': _df['Titulaire'].str.split(',').explode().str.strip(),
+        'Departments': _df['Departments'].explode(),
+        'Categories': _df['Categories'].explode(),
     }
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def compute_facets(_df, version):
+    """Valeurs proposées par les filtres, triées et sans doublons"""
+    long_values = explode_multivalued(_df, version)
     
-    for category, keywords in category_keywords.items():
-        if any(keyword in lot_name for keyword in keywords):
-            categories.append(category)
+    def sorted_unique(values):
+        return np.sort(values.dropna().unique().astype(object)).tolist()
     
-    return categories
+    return {
+        'acheteurs': _df['Resource'].cat.categories.tolist(),
+        'titulaires': sorted_unique(long_values['Titulaire']),
+        'departments': sorted_unique(long_values['Departments']),
+        'categories': sorted_unique(long_values['Categories']),
+    }
 
-def prepare_timeline_data(data):
-    timeline_data = []
-    today = pd.Timestamp.now()
-    
-    for item in data:
-        try:
-            start_date = pd.to_datetime(item['date_debut'])
-            end_date = pd.to_datetime(item['date_fin'])
-            
-            if pd.isna(start_date) or pd.isna(end_date):
-                continue
-                
-            days_left = (end_date - today).days
-            status = "Terminé" if days_left < 0 else "En cours"
-            
-            titulaires = ", ".join(item['titulaire']) if isinstance(item['titulaire'], list) else str(item['titulaire'])
-            departments = item['code_departement'] if isinstance(item['code_departement'], list) else [str(item['code_departement'])]
-            
-            # Traitement des lots
-            lots = item.get('LOTS', [])
-            all_categories = set()
-            for lot in lots:
-                all_categories.update(categorize_lot(lot))
-            
-            timeline_data.append(dict(
-                Task=f"[{status}] " + (item['objet'][:80] + '...' if len(item['objet']) > 80 else item['objet']),
-                Start=start_date,
-                Finish=end_date,
-                Resource=item['nomacheteur'],
-                Department=", ".join(departments),
-                Departments=departments,
-                Titulaire=titulaires,
-                Days_Left=days_left,
-                Status=status,
-                Lots=lots,
-                Categories=list(all_categories),
-                URL=item.get('url_avis', '')  # Ajout de l'URL
-            ))
-        except (TypeError, ValueError, KeyError) as e:
-            st.warning(f"Erreur avec l'entrée: {item.get('idweb', 'ID inconnu')} - {str(e)}")
-            continue
-            
-    return pd.DataFrame(timeline_data)
+def any_selected(long_values, selected, index):
+    """Masque des lignes de index ayant au moins une valeur parmi selected"""
+    return long_values.isin(selected).groupby(level=0).any().reindex(index, fill_value=False)
 
-def create_timeline_figure(df):
-    df_active = df[df['Status'] == "En cours"]
-    df_finished = df[df['Status'] == "Terminé"]
-    
-    fig = px.timeline(
-        df_active,
-        x_start='Start',
-        x_end='Finish',
-        y='Task',
-        color='Resource',
-        hover_data=['Titulaire', 'Days_Left', 'Status']
-    )
+# Au-delà de ce nombre de barres, seules celles qui croisent la plage affichée par défaut sont tracées
+MAX_TIMELINE_BARS = 500
+
+TIMELINE_HOVER_COLUMNS = ['Start', 'Finish', 'Titulaire', 'Days_Left', 'Status']
+# Mêmes champs et même ordre que l'infobulle de px.timeline
+TIMELINE_HOVERTEMPLATE = (
+    "Start=%{customdata[0]}<br>Finish=%{customdata[1]}<br>Task=%{y}<br>"
+    "Titulaire=%{customdata[2]}<br>Days_Left=%{customdata[3]}<br>Status=%{customdata[4]}"
+    "<extra></extra>"
+)
+
+def timeline_trace(df, name, visible_range, color=None, show_resource=True, showlegend=True):
+    """
+    Barres de la timeline sous forme d'une seule trace WebGL :
+    chaque AO est un segment épais (début, point de survol, fin) suivi d'une rupture (None).
+    En mode 'lines', l'infobulle n'apparaît que sur les sommets : le point de survol est
+    placé au milieu de la partie de la barre visible dans visible_range, ou au milieu de
+    la barre entière si elle est hors de cette plage.
+    Avec show_resource, l'infobulle commence par l'acheteur (le nom de la trace).
+    """
+    start, finish = df['Start'], df['Finish']
+    visible_start = start.clip(lower=pd.Timestamp(visible_range[0]))
+    visible_end = finish.clip(upper=pd.Timestamp(visible_range[1]))
+    outside = visible_start > visible_end
+    visible_start = visible_start.mask(outside, start)
+    visible_end = visible_end.mask(outside, finish)
+    hover_x = visible_start + (visible_end - visible_start) / 2
     
-    if not df_finished.empty:
-        fig.add_traces(
-            px.timeline(
-                df_finished,
-                x_start='Start',
-                x_end='Finish',
-                y='Task',
-                color_discrete_sequence=['lightgray'],
-                hover_data=['Titulaire', 'Days_Left', 'Status']
-            ).data
-        )
+    x = np.full(4 * len(df), None, dtype=object)
+    x[0::4] = start.dt.to_pydatetime()
+    x[1::4] = hover_x.dt.to_pydatetime()
+    x[2::4] = finish.dt.to_pydatetime()
     
+    y = np.full(4 * len(df), None, dtype=object)
+    y[0::4] = y[1::4] = y[2::4] = df['Task'].to_numpy(dtype=object)
+    
+    hover = df[TIMELINE_HOVER_COLUMNS].astype(str).to_numpy(dtype=object)
+    
+    return go.Scattergl(
+        x=x,
+        y=y,
+        mode='lines',
+        name=str(name),
+        showlegend=showlegend,
+        line=dict(width=10, color=color),
+        customdata=np.repeat(hover, 4, axis=0),
+        hovertemplate=(f"Resource={name}<br>" if show_resource else "") + TIMELINE_HOVERTEMPLATE
+    )
+
+FINISHED_KEY = '__finished__'
+
+# Colonnes lues par create_timeline_figure, qui servent à calculer sa clé de cache
+TIMELINE_COLUMNS = ['Task', 'Resource', *TIMELINE_HOVER_COLUMNS]
+
+def create_timeline_figure(df):
     today = datetime.now()
+    start_range = today - timedelta(days=30)
+    end_range = today + timedelta(days=365)
+    
+    if len(df) > MAX_TIMELINE_BARS:
+        df = df[(df['Finish'] >= start_range) & (df['Start'] <= end_range)]
+    
+    # Une seule clé de couleur : l'acheteur pour les AO en cours, une clé commune pour les terminés
+    color_key = np.where(df['Status'] == "Terminé", FINISHED_KEY, df['Resource'].astype(str))
+    
+    fig = go.Figure()
+    # Tri stable : les AO terminés passent en dernier, les acheteurs gardent leur ordre d'apparition
+    for key, group in sorted(df.groupby(color_key, sort=False), key=lambda item: item[0] == FINISHED_KEY):
+        if key == FINISHED_KEY:
+            fig.add_trace(timeline_trace(
+                group, "Terminé", (start_range, end_range), color='lightgray',
+                show_resource=False, showlegend=False
+            ))
+        else:
+            fig.add_trace(timeline_trace(group, key, (start_range, end_range)))
+    
     fig.add_vline(
         x=today.strftime('%Y-%m-%d'),
         line_dash="dash",
@@ -126,6 +266,7 @@ def create_timeline_figure(df):
     
     fig.update_layout(
         height=800,
+        yaxis_type='category',
         xaxis_title="Date",
         yaxis_title="Appels d'Offre",
         showlegend=True,
@@ -138,61 +279,76 @@ def create_timeline_figure(df):
         }
     )
     
-    start_range = today - timedelta(days=30)
-    end_range = today + timedelta(days=365)
-    
     fig.update_xaxes(
         range=[start_range.strftime('%Y-%m-%d'), end_range.strftime('%Y-%m-%d')]
     )
     
     return fig
 
+# Filtre de date de fin : libellé -> nombre maximal de jours restants
+EXPIRATION_DAYS = {
+    "Se termine dans 3 mois": 90,
+    "Se termine dans 6 mois": 180,
+    "Se termine dans 1 an": 365,
+    "Se termine dans 1 an et demi": 547,
+    "Se termine dans 2 ans": 730
+}
+
+# Nombre d'AO détaillés par page
+DETAILS_PAGE_SIZE = 50
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def cached_timeline_figure(_df, df_hash, today):
+    """
+    create_timeline_figure mémorisé : la figure n'est reconstruite que si
+    les données tracées (df_hash) ou la date du jour changent
+    """
+    return create_timeline_figure(_df)
+
 def main():
     st.title("📊 Suivi des Appels d'Offre")
     
-    data = load_data()
-    df = prepare_timeline_data(data)
+    if st.button("🔄 Recharger les données"):
+        load_data.clear()
+        prepare_timeline_data.clear()
+    
+    mtime = os.path.getmtime(DATA_FILE)
+    data = load_data(mtime)
+    df, version = prepare_timeline_data(data, mtime)
     
     if df.empty:
         st.error("Aucune donnée valide n'a été trouvée.")
         return
     
     # Filtres
+    facets = compute_facets(df, version)
     col1, col2, col3, col4, col5, col6 = st.columns(6)
     
     with col1:
-        acheteurs = sorted(list(set(df['Resource'])))
         selected_acheteurs = st.multiselect(
             "🏢 Acheteurs",
-            acheteurs,
+            facets['acheteurs'],
             help="Sélectionnez un ou plusieurs acheteurs"
         )
 
     with col2:
-        titulaires = sorted(list(set([t.strip() for titulaire in df['Titulaire'].str.split(',') for t in titulaire])))
         selected_titulaires = st.multiselect(
             "👥 Titulaires",
-            titulaires,
+            facets['titulaires'],
             help="Sélectionnez un ou plusieurs titulaires"
         )
     
     with col3:
-        all_departments = sorted(list(set([dept for deps in df['Departments'] for dept in deps])))
         selected_departments = st.multiselect(
             "🗺️ Départements",
-            all_departments,
+            facets['departments'],
             help="Sélectionnez un ou plusieurs départements"
         )
 
     with col4:
         expiration_filter = st.selectbox(
             "⚠️ Filtrer par date de fin",
-            ["Tous les AO", 
-             "Se termine dans 3 mois", 
-             "Se termine dans 6 mois", 
-             "Se termine dans 1 an",
-             "Se termine dans 1 an et demi",
-             "Se termine dans 2 ans"]
+            ["Tous les AO", *EXPIRATION_DAYS]
         )
     
     with col5:
@@ -204,55 +360,50 @@ def main():
         )
         
     with col6:
-        all_categories = sorted(list(set([cat for cats in df['Categories'] for cat in cats])))
         selected_categories = st.multiselect(
             "📦 Catégories de Lots",
-            all_categories,
+            facets['categories'],
             help="Sélectionnez une ou plusieurs catégories de lots"
         )
     
-    # Application des filtres
-    filtered_df = df.copy()
+    # Application des filtres : un seul masque booléen, appliqué une seule fois
+    long_values = explode_multivalued(df, version)
+    mask = np.ones(len(df), dtype=bool)
     
     if selected_acheteurs:
-        filtered_df = filtered_df[filtered_df['Resource'].isin(selected_acheteurs)]
+        mask &= df['Resource'].isin(selected_acheteurs).to_numpy()
     
     if selected_titulaires:
-        filtered_df = filtered_df[filtered_df['Titulaire'].apply(lambda x: any(t.strip() in selected_titulaires for t in x.split(',')))]
+        mask &= any_selected(long_values['Titulaire'], selected_titulaires, df.index).to_numpy()
     
     if selected_departments:
-        filtered_df = filtered_df[filtered_df['Departments'].apply(lambda x: any(dept in selected_departments for dept in x))]
-    
-    if expiration_filter != "Tous les AO":
-        if "3 mois" in expiration_filter:
-            filtered_df = filtered_df[filtered_df['Days_Left'] <= 90]
-        elif "6 mois" in expiration_filter:
-            filtered_df = filtered_df[filtered_df['Days_Left'] <= 180]
-        elif "1 an" in expiration_filter:
-            filtered_df = filtered_df[filtered_df['Days_Left'] <= 365]
-        elif "1 an et demi" in expiration_filter:
-            filtered_df = filtered_df[filtered_df['Days_Left'] <= 547]
-        elif "2 ans" in expiration_filter:
-            filtered_df = filtered_df[filtered_df['Days_Left'] <= 730]
+        mask &= any_selected(long_values['Departments'], selected_departments, df.index).to_numpy()
+    
+    max_days_left = EXPIRATION_DAYS.get(expiration_filter)
+    if max_days_left is not None:
+        mask &= df['Days_Left'].to_numpy() <= max_days_left
     
     if status_filter:
-        filtered_df = filtered_df[filtered_df['Status'].isin(status_filter)]
+        mask &= df['Status'].isin(status_filter).to_numpy()
         
     if selected_categories:
-        filtered_df = filtered_df[filtered_df['Categories'].apply(lambda x: any(cat in selected_categories for cat in x))]
+        selected_bits = sum(CATEGORY_BITS[c] for c in selected_categories)
+        mask &= (df['Category_Bits'].to_numpy() & selected_bits) != 0
+    
+    filtered_df = df.loc[mask]
     
     if not filtered_df.empty:
-        # Création d'un dictionnaire pour stocker les ancres des détails
-        detail_anchors = {}
-        for idx, row in filtered_df.iterrows():
-            anchor_id = f"detail_{idx}"
-            detail_anchors[row['Task']] = anchor_id
-
         # Création du graphique
-        fig = create_timeline_figure(filtered_df)
+        df_hash = int(pd.util.hash_pandas_object(filtered_df[TIMELINE_COLUMNS]).sum())
+        fig = cached_timeline_figure(filtered_df, df_hash, date.today())
         
         # Affichage du graphique
         st.plotly_chart(fig, use_container_width=True)
+        if len(filtered_df) > MAX_TIMELINE_BARS:
+            st.caption(
+                f"Plus de {MAX_TIMELINE_BARS} AO sélectionnés : la timeline n'affiche que ceux "
+                "qui se déroulent entre le mois dernier et l'année prochaine."
+            )
         
         
         # Statistiques
@@ -273,41 +424,36 @@ def main():
             
         # Affichage des détails
         st.header("Détails des Appels d'Offre")
-        for idx, row in filtered_df.iterrows():
-            # Création d'un identifiant unique pour chaque détail
-            st.markdown(f"<div id='{detail_anchors[row['Task']]}'></div>", unsafe_allow_html=True)
-            
-            with st.expander(row['Task']):
+        page_count = math.ceil(len(filtered_df) / DETAILS_PAGE_SIZE)
+        page = 1
+        if page_count > 1:
+            page = st.number_input(
+                f"Page (sur {page_count})",
+                min_value=1,
+                max_value=page_count,
+                value=1,
+                help=f"{DETAILS_PAGE_SIZE} appels d'offre par page"
+            )
+        page_df = filtered_df.iloc[(page - 1) * DETAILS_PAGE_SIZE:page * DETAILS_PAGE_SIZE]
+        for row in page_df.itertuples():
+            with st.expander(row.Task):
                 col1, col2 = st.columns(2)
                 with col1:
-                    st.write(f"**Acheteur:** {row['Resource']}")
-                    st.write(f"**Titulaire:** {row['Titulaire']}")
-                    st.write(f"**Départements:** {row['Department']}")
-                    if row['URL']:  # Ajout du lien
-                        st.markdown(f"**[Lien vers l'avis complet]({row['URL']})**")
+                    st.write(f"**Acheteur:** {row.Resource}")
+                    st.write(f"**Titulaire:** {row.Titulaire}")
+                    st.write(f"**Départements:** {row.Department}")
+                    if row.URL:  # Ajout du lien
+                        st.markdown(f"**[Lien vers l'avis complet]({row.URL})**")
                 with col2:
-                    st.write(f"**Date début:** {row['Start'].strftime('%Y-%m-%d')}")
-                    st.write(f"**Date fin:** {row['Finish'].strftime('%Y-%m-%d')}")
-                    st.write(f"**Statut:** {row['Status']}")
+                    st.write(f"**Date début:** {row.Start.strftime('%Y-%m-%d')}")
+                    st.write(f"**Date fin:** {row.Finish.strftime('%Y-%m-%d')}")
+                    st.write(f"**Statut:** {row.Status}")
                 st.write("**Lots et Catégories:**")
-                for lot in row['Lots']:
-                    categories = categorize_lot(lot)
+                for lot, categories in row.Lots:
                     st.write(f"- {lot}")
                     if categories:
                         st.write(f"  *Catégories: {', '.join(categories)}*")
 
-        # Ajout du JavaScript pour permettre la navigation
-        st.markdown("""
-        <script>
-            function scrollToDetail(detailId) {
-                const element = document.getElementById(detailId);
-                if (element) {
-                    element.scrollIntoView({ behavior: 'smooth' });
-                }
-            }
-        </script>
-        """, unsafe_allow_html=True)
-
     else:
         st.warning("Aucune donnée ne correspond aux filtres sélectionnés")
 